@@ -21,6 +21,7 @@ Options:
     --duration    Duration of simulation in seconds (default: 5)
     --policy      How priorities are assigned: [random|by_flow|uniform]
     --seed        Random seed (optional)
+    --batch       Generate the whole trace at once (no real-time pacing)
 """
 
 import argparse
@@ -28,6 +29,39 @@ import random
 import sys
 import time
 
+import numpy as np
+
+
+def generate_batch(args):
+    """Emit the whole trace at once with vectorized column generation.
+
+    Arrivals are spaced deterministically at 1/rate with `burst` packets
+    per tick; all random columns come from one NumPy generator, so a seed
+    reproduces the trace exactly.
+    """
+    rng = np.random.default_rng(args.seed)
+    ticks = int(args.rate * args.duration)
+    n = ticks * args.burst
+    arrival_ms = np.repeat(np.arange(ticks) / args.rate * 1000.0, args.burst)
+    flow_id = rng.integers(1, args.flows + 1, size=n)
+
+    # Determine priorities column-wise
+    if args.policy == "random":
+        priority = rng.integers(0, 4, size=n)
+    elif args.policy == "by_flow":
+        priority = (flow_id - 1) % 4
+    else:  # uniform
+        priority = np.full(n, 1)
+
+    size = rng.choice([256, 512, 1024, 1500], size=n)
+    lines = [f"{t:.1f} {fid} {prio} {sz} DATA_{k + 1}\n"
+             for k, (t, fid, prio, sz)
+             in enumerate(zip(arrival_ms.tolist(), flow_id.tolist(),
+                              priority.tolist(), size.tolist()))]
+    sys.stdout.write("".join(lines))
+    print("# END")
+    sys.stdout.flush()
+
 def main():
     parser = argparse.ArgumentParser(description="Datagram generator for router simulation.")
     parser.add_argument("--rate", type=float, default=10.0, help="Average datagram rate per second")
@@ -37,41 +71,65 @@ def main():
     parser.add_argument("--policy", type=str, choices=["random", "by_flow", "uniform"], default="random",
                         help="Priority assignment policy")
     parser.add_argument("--seed", type=int, help="Random seed for reproducibility")
+    parser.add_argument("--batch", action="store_true",
+                        help="Generate the whole trace at once without pacing")
     args = parser.parse_args()
 
+    if args.batch:
+        generate_batch(args)
+        return
+
     if args.seed is not None:
         random.seed(args.seed)
 
-    total_packets = int(args.rate * args.duration)
     inter_arrival_time = 1.0 / args.rate  # seconds
 
-    start_time = time.time()
-    current_time = 0.0
+    # Sleep once per ~10ms worth of ticks rather than once per tick: a
+    # time.sleep() call costs tens of microseconds of syscall/wakeup latency,
+    # so per-tick sleeping caps the achievable rate far below --rate
+    batch_size = max(1, int(args.rate / 100))
+    batch_interval = batch_size * inter_arrival_time
+
+    start_time = time.perf_counter()
+    next_deadline = start_time + batch_interval
+    tick_index = 0
     packet_id = 0
 
-    while current_time < args.duration:
-        for _ in range(args.burst):
-            packet_id += 1
-            flow_id = random.randint(1, args.flows)
-
-            # Determine priority
-            if args.policy == "random":
-                priority = random.randint(0, 3)
-            elif args.policy == "by_flow":
-                priority = (flow_id - 1) % 4
-            else:  # uniform
-                priority = 1
-
-            size = random.choice([256, 512, 1024, 1500])
-            payload = f"DATA_{packet_id}"
-
-            # Output format: arrival_time_ms flow_id priority size payload
-            print(f"{current_time*1000:.1f} {flow_id} {priority} {size} {payload}")
-            sys.stdout.flush()
-
-        # Sleep to simulate real-time pacing
-        time.sleep(inter_arrival_time)
-        current_time = time.time() - start_time
+    while tick_index * inter_arrival_time < args.duration:
+        # Emit a whole batch of ticks between sleeps, stamping each tick
+        # from the same nominal grid the sleep deadlines track — monotone
+        # by construction, regardless of scheduler jitter
+        for _ in range(batch_size):
+            tick_time = tick_index * inter_arrival_time
+            if tick_time >= args.duration:
+                break
+            tick_index += 1
+            for _ in range(args.burst):
+                packet_id += 1
+                flow_id = random.randint(1, args.flows)
+
+                # Determine priority
+                if args.policy == "random":
+                    priority = random.randint(0, 3)
+                elif args.policy == "by_flow":
+                    priority = (flow_id - 1) % 4
+                else:  # uniform
+                    priority = 1
+
+                size = random.choice([256, 512, 1024, 1500])
+                payload = f"DATA_{packet_id}"
+
+                # Output format: arrival_time_ms flow_id priority size payload
+                # (no per-line flush: stdout is already line-buffered on a tty,
+                # and the final flush below covers piped output)
+                print(f"{tick_time*1000:.1f} {flow_id} {priority} {size} {payload}")
+
+        # Drift-correcting pacing: deadlines advance on the ideal grid, so
+        # any oversleep shrinks the next sleep instead of accumulating
+        sleep_s = next_deadline - time.perf_counter()
+        if sleep_s > 0:
+            time.sleep(sleep_s)
+        next_deadline += batch_interval
 
     # Print end marker (optional)
     print("# END")